@@ -1,17 +1,20 @@
 import base64
 import json
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from responses import Response
 
 from localstack.constants import HEADER_LOCALSTACK_EDGE_URL
 from localstack.utils.aws.aws_responses import parse_query_string
-from localstack.utils.strings import short_uid, to_str
+from localstack.utils.strings import short_uid
 
 # type definition for data parameters (i.e., invocation payloads)
 InvocationPayload = Union[Dict, str, bytes]
 
+# encoder used to serialize dict/list payloads - uses a compact format and keeps non-ASCII characters as-is
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 
 class ApiGatewayVersion(Enum):
     V1 = "v1"
@@ -21,6 +24,35 @@ class ApiGatewayVersion(Enum):
 class ApiInvocationContext:
     """Represents the context for an incoming API Gateway invocation."""
 
+    # use slots to avoid a per-instance dict, as a context is created for every incoming invocation
+    __slots__ = (
+        "method",
+        "path",
+        "_data",
+        "_headers",
+        "context",
+        "auth_context",
+        "apigw_version",
+        "api_id",
+        "stage",
+        "account_id",
+        "region_name",
+        "resource_path",
+        "integration",
+        "resource",
+        "_path_with_query_string",
+        "response_templates",
+        "route",
+        "connection_id",
+        "path_params",
+        "response",
+        "stage_variables",
+        "ws_route",
+        "_decoded_cache",
+        "_host_cache",
+        "_query_params_cache",
+    )
+
     # basic (raw) HTTP invocation details (method, path, data, headers)
     method: str
     path: str
@@ -62,6 +94,13 @@ class ApiInvocationContext:
     # websockets route selection
     ws_route: str
 
+    # cached result of decoding the invocation payload, see `_decoded_payload()`
+    _decoded_cache: Optional[Tuple[Any, bool]]
+    # cached host name extracted from the request headers, see `_extract_host_from_header()`
+    _host_cache: Optional[str]
+    # cached query parameters, as tuple of the raw query string and the parsed parameters
+    _query_params_cache: Optional[Tuple[str, Dict[str, str]]]
+
     def __init__(
         self,
         method: str,
@@ -77,8 +116,10 @@ class ApiInvocationContext:
         self.path = path
         self.data = data
         self.headers = headers
+        self._query_params_cache = None
         self.context = {"requestId": short_uid()} if context is None else context
-        self.auth_context = {} if auth_context is None else auth_context
+        # the auth context is guaranteed to be a dict, which allows the accessors below to skip type checks
+        self.auth_context = auth_context if isinstance(auth_context, dict) else {}
         self.apigw_version = None
         self.api_id = api_id
         self.stage = stage
@@ -92,9 +133,28 @@ class ApiInvocationContext:
         self.stage_variables = {}
         self.path_params = {}
         self.route = None
+        self.connection_id = None
         self.ws_route = None
         self.response = None
 
+    @property
+    def data(self) -> InvocationPayload:
+        return self._data
+
+    @data.setter
+    def data(self, new_data: InvocationPayload):
+        self._data = new_data
+        self._decoded_cache = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self._headers
+
+    @headers.setter
+    def headers(self, new_headers: Dict[str, str]):
+        self._headers = new_headers
+        self._host_cache = None
+
     @property
     def resource_id(self) -> Optional[str]:
         return (self.resource or {}).get("id")
@@ -102,8 +162,7 @@ class ApiInvocationContext:
     @property
     def invocation_path(self) -> str:
         """Return the plain invocation path, without query parameters."""
-        path = self.path_with_query_string or self.path
-        return path.split("?")[0]
+        return self.path_with_query_string.partition("?")[0]
 
     @property
     def path_with_query_string(self) -> str:
@@ -118,7 +177,14 @@ class ApiInvocationContext:
     def query_params(self) -> Dict[str, str]:
         """Extract the query parameters from the target URL or path in this request context."""
         query_string = self.path_with_query_string.partition("?")[2]
-        return parse_query_string(query_string)
+        if not query_string:
+            # fast path for the common case of requests without query string
+            return {}
+        cached = self._query_params_cache
+        if cached is None or cached[0] != query_string:
+            cached = self._query_params_cache = (query_string, parse_query_string(query_string))
+        # return a copy, as callers (e.g., templates) may modify the result
+        return dict(cached[1])
 
     @property
     def integration_uri(self) -> Optional[str]:
@@ -127,24 +193,20 @@ class ApiInvocationContext:
 
     @property
     def auth_identity(self) -> Optional[Dict]:
-        if isinstance(self.auth_context, dict):
-            if self.auth_context.get("identity") is None:
-                self.auth_context["identity"] = {}
-            return self.auth_context["identity"]
+        if self.auth_context.get("identity") is None:
+            self.auth_context["identity"] = {}
+        return self.auth_context["identity"]
 
     @property
     def authorizer_type(self) -> str:
-        if isinstance(self.auth_context, dict):
-            return self.auth_context.get("authorizer_type") if self.auth_context else None
+        return self.auth_context.get("authorizer_type")
 
     @property
     def authorizer_result(self) -> Dict[str, Any]:
-        if isinstance(self.auth_context, dict):
-            return self.auth_context.get("authorizer") if self.auth_context else {}
+        return self.auth_context.get("authorizer") if self.auth_context else {}
 
     def is_websocket_request(self) -> bool:
-        upgrade_header = str(self.headers.get("upgrade") or "")
-        return upgrade_header.lower() == "websocket"
+        return (self.headers.get("upgrade") or "").lower() == "websocket"
 
     def is_v1(self) -> bool:
         """Whether this is an API Gateway v1 request"""
@@ -152,29 +214,47 @@ class ApiInvocationContext:
 
     def cookies(self) -> Optional[List[str]]:
         if cookies := self.headers.get("cookie") or "":
-            return list(cookies.split(";"))
+            return [cookie.strip() for cookie in cookies.split(";") if cookie.strip()]
         return None
 
     @property
     def is_data_base64_encoded(self) -> bool:
-        try:
-            json.dumps(self.data) if isinstance(self.data, (dict, list)) else to_str(self.data)
-            return False
-        except UnicodeDecodeError:
-            return True
+        return self._decoded_payload()[1]
 
     def data_as_string(self) -> str:
-        try:
-            return (
-                json.dumps(self.data) if isinstance(self.data, (dict, list)) else to_str(self.data)
-            )
-        except UnicodeDecodeError:
-            # we string encode our base64 as string as well
-            return to_str(base64.b64encode(self.data))
+        return self._decoded_payload()[0]
+
+    def _decoded_payload(self) -> Tuple[Any, bool]:
+        """
+        Return the invocation payload as string, together with a flag indicating whether the string is base64
+        encoded (i.e., the payload is binary and cannot be decoded as UTF-8). The result is cached until the
+        payload is replaced.
+        """
+        if self._decoded_cache is None:
+            data = self._data
+            if isinstance(data, (dict, list)):
+                self._decoded_cache = (_dumps(data), False)
+            elif isinstance(data, (bytes, bytearray)):
+                try:
+                    self._decoded_cache = (data.decode("utf-8", errors="strict"), False)
+                except UnicodeDecodeError:
+                    # we string encode our base64 as string as well
+                    self._decoded_cache = (base64.b64encode(data).decode("ascii"), True)
+            else:
+                self._decoded_cache = (data, False)
+        return self._decoded_cache
 
     def _extract_host_from_header(self) -> str:
-        host = self.headers.get(HEADER_LOCALSTACK_EDGE_URL) or self.headers.get("host", "")
-        return host.split("://")[-1].split("/")[0].split(":")[0]
+        if self._host_cache is None:
+            host = self.headers.get(HEADER_LOCALSTACK_EDGE_URL) or self.headers.get("host", "")
+            # single pass over the header value: strip the scheme, the path, and the port
+            start = host.rfind("://")
+            start = 0 if start == -1 else start + 3
+            end = host.find("/", start)
+            end = len(host) if end == -1 else end
+            port = host.find(":", start, end)
+            self._host_cache = host[start : end if port == -1 else port]
+        return self._host_cache
 
     @property
     def domain_name(self) -> str:
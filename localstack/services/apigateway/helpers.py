@@ -272,7 +272,8 @@ def get_stage_variables(context: ApiInvocationContext) -> Optional[Dict[str, str
     if not context.stage:
         return {}
 
-    _, region_name = get_api_account_id_and_region(context.api_id)
+    # reuse the region if it has already been looked up for this invocation
+    region_name = context.region_name or get_api_account_id_and_region(context.api_id)[1]
     api_gateway_client = aws_stack.connect_to_service("apigateway", region_name=region_name)
     try:
         response = api_gateway_client.get_stage(restApiId=context.api_id, stageName=context.stage)
@@ -883,7 +884,9 @@ def set_api_id_stage_invocation_path(
         # set current region in request thread local, to ensure aws_stack.get_region() works properly
         # TODO: replace with RequestContextManager
         if getattr(THREAD_LOCAL, "request_context", None) is not None:
-            _, api_region = get_api_account_id_and_region(api_id)
+            api_region = (
+                invocation_context.region_name or get_api_account_id_and_region(api_id)[1]
+            )
             THREAD_LOCAL.request_context.headers[MARKER_APIGW_REQUEST_REGION] = api_region
 
     # set details in invocation context
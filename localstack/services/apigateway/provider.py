@@ -121,7 +121,7 @@ class ApigatewayProvider(ApigatewayApi, ServiceLifecycleHook):
 
         return TestInvokeMethodResponse(
             status=result.status_code,
-            headers=dict(result.headers),
+            headers=dict(result.headers.items()),
             body=to_str(result.content),
         )
 
@@ -4,6 +4,7 @@ from typing import Any, Dict
 from requests.models import Response as RequestsResponse
 from werkzeug.datastructures import Headers
 from werkzeug.exceptions import NotFound
+from werkzeug.routing import Rule, Submount
 
 from localstack.constants import HEADER_LOCALSTACK_EDGE_URL
 from localstack.http import Request, Response, Router
@@ -21,13 +22,14 @@ LOG = logging.getLogger(__name__)
 # invocation context property decorators and use the url_params directly,
 # something asked for a long time.
 def to_invocation_context(
-    request: Request, url_params: Dict[str, Any] = None
+    request: Request, url_params: Dict[str, Any] = None, region_name: str = None
 ) -> ApiInvocationContext:
     """
     Converts an HTTP Request object into an ApiInvocationContext.
 
     :param request: the original request
     :param url_params: the parameters extracted from the URL matching rules
+    :param region_name: the region of the target API, if it has already been determined
     :return: the ApiInvocationContext
     """
     if url_params is None:
@@ -41,20 +43,26 @@ def to_invocation_context(
     headers = Headers(request.headers)
 
     # adjust the X-Forwarded-For header
-    x_forwarded_for = headers.getlist("X-Forwarded-For")
-    x_forwarded_for.append(request.remote_addr)
-    x_forwarded_for.append(request.host)
-    headers["X-Forwarded-For"] = ", ".join(x_forwarded_for)
+    forwarded_for = f"{request.remote_addr}, {request.host}"
+    if "X-Forwarded-For" in headers:
+        # only collect the existing values (which may be spread across multiple header lines) if there are any
+        x_forwarded_for = ", ".join(headers.getlist("X-Forwarded-For"))
+        forwarded_for = f"{x_forwarded_for}, {forwarded_for}"
+    headers["X-Forwarded-For"] = forwarded_for
 
     # set the x-localstack-edge header, it is used to parse the domain
-    headers[HEADER_LOCALSTACK_EDGE_URL] = request.host_url.strip("/")
+    headers[HEADER_LOCALSTACK_EDGE_URL] = f"{request.scheme}://{request.host}"
 
     # FIXME: Use the already parsed url params instead of parsing them into the ApiInvocationContext part-by-part.
     #   We already would have all params at hand to avoid _all_ the parsing, but the parsing
     #   has side-effects (f.e. setting the region in a thread local)!
     #   It would be best to use a small (immutable) context for the already parsed params and the Request object
     #   and use it everywhere.
-    return ApiInvocationContext(method, path, data, headers, stage=url_params.get("stage"))
+    invocation_context = ApiInvocationContext(
+        method, path, data, headers, stage=url_params.get("stage")
+    )
+    invocation_context.region_name = region_name
+    return invocation_context
 
 
 def convert_response(result: RequestsResponse) -> Response:
@@ -103,46 +111,48 @@ class ApigatewayRouter:
             return
         self.registered = True
         LOG.debug("Registering parameterized API Gateway routes.")
-        host_pattern = "<regex('[^-]+'):api_id><regex('(-vpce-[^.]+)?'):vpce_suffix>.execute-api.<regex('.*'):server>"
-        self.router.add(
-            "/",
-            host=host_pattern,
-            endpoint=self.invoke_rest_api,
-            defaults={"path": "", "stage": None},
-            strict_slashes=True,
-        )
-        self.router.add(
-            "/<stage>/",
-            host=host_pattern,
-            endpoint=self.invoke_rest_api,
-            defaults={"path": ""},
-            strict_slashes=False,
-        )
-        self.router.add(
-            "/<stage>/<path:path>",
-            host=host_pattern,
-            endpoint=self.invoke_rest_api,
-            strict_slashes=True,
-        )
-
-        # add the localstack-specific _user_request_ routes
-        self.router.add(
-            "/restapis/<api_id>/<stage>/_user_request_",
-            endpoint=self.invoke_rest_api,
-            defaults={"path": ""},
-        )
-        self.router.add(
-            "/restapis/<api_id>/<stage>/_user_request_/<path:path>",
-            endpoint=self.invoke_rest_api,
-            strict_slashes=True,
-        )
+        host_pattern = "<regex('[^-]+'):api_id><regex('(-vpce-[^.]+)?'):vpce_suffix>.execute-api.<regex('[^/]+'):server>"
+        rules = [
+            Rule(
+                "/",
+                host=host_pattern,
+                endpoint=self.invoke_rest_api,
+                defaults={"path": "", "stage": None},
+                strict_slashes=True,
+            ),
+            Rule(
+                "/<stage>/",
+                host=host_pattern,
+                endpoint=self.invoke_rest_api,
+                defaults={"path": ""},
+                strict_slashes=False,
+            ),
+            Rule(
+                "/<stage>/<path:path>",
+                host=host_pattern,
+                endpoint=self.invoke_rest_api,
+                strict_slashes=True,
+            ),
+            # add the localstack-specific _user_request_ routes
+            Rule(
+                "/restapis/<api_id>/<stage>/_user_request_",
+                endpoint=self.invoke_rest_api,
+                defaults={"path": ""},
+            ),
+            Rule(
+                "/restapis/<api_id>/<stage>/_user_request_/<path:path>",
+                endpoint=self.invoke_rest_api,
+                strict_slashes=True,
+            ),
+        ]
+        # add all rules in a single batch, which only acquires the router lock once
+        self.router.add(Submount("", rules))
 
     def invoke_rest_api(self, request: Request, **url_params: Dict[str, str]) -> Response:
         _, region_name = get_api_account_id_and_region(url_params["api_id"])
         if not region_name:
             return Response(status=404)
-        invocation_context = to_invocation_context(request, url_params)
-        invocation_context.region_name = region_name
+        invocation_context = to_invocation_context(request, url_params, region_name=region_name)
         result = invoke_rest_api_from_request(invocation_context)
         if result is not None:
             return convert_response(result)
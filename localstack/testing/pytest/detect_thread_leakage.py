@@ -10,18 +10,18 @@ import pytest
 
 @pytest.hookimpl(trylast=True)
 def pytest_unconfigure(config):
-    print(
-        f"Still running threads after pytest unconfigure: {threading.enumerate()}, Count: {threading.active_count()}"
-    )
-    thread_frames = [
-        (sys._current_frames().get(thread.ident), thread) for thread in threading.enumerate()
-    ]
+    # take a single snapshot of the running threads and their frames, so the report is consistent
+    threads = threading.enumerate()
+    current_frames = sys._current_frames()
+    print(f"Still running threads after pytest unconfigure: {threads}, Count: {len(threads)}")
+    thread_frames = [(current_frames.get(thread.ident), thread) for thread in threads]
     info_tuples = [
         {
             "file_name": frame.f_code.co_filename,
             "function_name": frame.f_code.co_name,
             "line_no": frame.f_code.co_firstlineno,
             "frame_traceback": traceback.format_stack(frame),
+            "thread_id": thread.ident,
             "thread_name": thread.name,
             "thread_target": repr(thread._target) if hasattr(thread, "_target") else None,
             "thread_target_file": inspect.getfile(thread._target)
@@ -7,9 +7,11 @@ from unittest.mock import Mock
 import boto3
 import pytest
 from botocore.exceptions import ClientError
+from werkzeug.datastructures import Headers
 
 from localstack import config
-from localstack.constants import APPLICATION_JSON
+from localstack.constants import APPLICATION_JSON, HEADER_LOCALSTACK_EDGE_URL
+from localstack.http import Request, Response, Router
 from localstack.services.apigateway.helpers import (
     RequestParametersResolver,
     Resolver,
@@ -24,6 +26,7 @@ from localstack.services.apigateway.integration import (
     apply_request_parameters,
 )
 from localstack.services.apigateway.invocations import ApiInvocationContext, RequestValidator
+from localstack.services.apigateway.router_asf import ApigatewayRouter, to_invocation_context
 from localstack.services.apigateway.templates import (
     RequestTemplates,
     ResponseTemplates,
@@ -563,3 +566,90 @@ class TestRequestParameterResolver:
             "querystring": {"baz": "test", "token": "Bearer 1234", "env": "dev"},
             "headers": {"Content-Type": "application/json", "body-header": "spam_eggs"},
         }
+
+
+class TestApiInvocationContext:
+    def test_data_as_string(self):
+        context = ApiInvocationContext(method="POST", path="/", data=b'{"foo": "bar"}', headers={})
+        assert context.data_as_string() == '{"foo": "bar"}'
+        assert not context.is_data_base64_encoded
+
+        context.data = {"foo": "bär"}
+        assert context.data_as_string() == '{"foo":"bär"}'
+        assert not context.is_data_base64_encoded
+
+        context.data = b"\xff\xfe"
+        assert context.data_as_string() == "//4="
+        assert context.is_data_base64_encoded
+
+    def test_domain_name(self):
+        headers = {"host": "abc123.execute-api.localhost.localstack.cloud:4566"}
+        context = ApiInvocationContext(method="GET", path="/", data=b"", headers=headers)
+        assert context.domain_name == "abc123.execute-api.localhost.localstack.cloud"
+        assert context.domain_prefix == "abc123"
+
+        context.headers = {HEADER_LOCALSTACK_EDGE_URL: "https://example.com:443/foo/bar"}
+        assert context.domain_name == "example.com"
+        assert context.domain_prefix == "example"
+
+    def test_cookies(self):
+        context = ApiInvocationContext(method="GET", path="/", data=b"", headers={})
+        assert context.cookies() is None
+
+        context.headers = {"cookie": "foo=bar; baz=qux;"}
+        assert context.cookies() == ["foo=bar", "baz=qux"]
+
+
+class TestApigatewayRouter:
+    @staticmethod
+    def _match(host: str, path: str) -> Dict[str, Any]:
+        matched = []
+
+        def dispatcher(request, endpoint, args):
+            matched.append(args)
+            return Response()
+
+        router = Router(dispatcher=dispatcher)
+        ApigatewayRouter(router).register_routes()
+        router.dispatch(Request("GET", path, headers={"Host": host}))
+        return matched[0]
+
+    def test_match_host(self):
+        args = self._match("abc.execute-api.localhost.localstack.cloud:4566", "/dev/foo/bar")
+        assert args == {
+            "api_id": "abc",
+            "vpce_suffix": "",
+            "server": "localhost.localstack.cloud:4566",
+            "stage": "dev",
+            "path": "foo/bar",
+        }
+
+    def test_match_host_with_vpce_suffix(self):
+        args = self._match(
+            "abc-vpce-0123456789abcdef.execute-api.localhost.localstack.cloud:4566", "/dev/"
+        )
+        assert args == {
+            "api_id": "abc",
+            "vpce_suffix": "-vpce-0123456789abcdef",
+            "server": "localhost.localstack.cloud:4566",
+            "stage": "dev",
+            "path": "",
+        }
+
+
+@pytest.mark.parametrize(
+    "forwarded_for,expected",
+    [
+        ([], "127.0.0.1, localhost:4566"),
+        (["a"], "a, 127.0.0.1, localhost:4566"),
+        (["a", "b"], "a, b, 127.0.0.1, localhost:4566"),
+    ],
+)
+def test_to_invocation_context_x_forwarded_for(forwarded_for, expected):
+    headers = Headers({"Host": "localhost:4566"})
+    for value in forwarded_for:
+        headers.add("X-Forwarded-For", value)
+    request = Request("GET", "/", headers=headers, remote_addr="127.0.0.1")
+
+    context = to_invocation_context(request)
+    assert context.headers["X-Forwarded-For"] == expected